@@ -5,8 +5,9 @@ Handles loading and parsing configuration files.
 
 import json
 import logging
-import urllib.parse
-from typing import Dict, Any, List
+import os
+import re
+from typing import Dict, Any, List, Tuple
 
 
 
@@ -14,16 +15,37 @@ from NewsbankScraper.default_scraper import BASE_URL, HEADERS, DEFAULT_COOKIES,
 
 logger = logging.getLogger(__name__)
 
+# Splits a query on its boolean operators, keeping the operators in the result
+_OPERATOR_SPLIT_RE = re.compile(r'(?:^|\s+)(AND|OR)(?=\s|$)', re.IGNORECASE)
+
+# Percent-encoding for each byte value, matching urllib.parse.quote(s, safe='/')
+_QUOTE_SAFE = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~/')
+_QUOTE_TABLE = tuple(chr(b) if b in _QUOTE_SAFE else f'%{b:02X}' for b in range(256))
+
+# Pre-formatted (val, fld, bln) parameter names for the first search terms
+_CACHED_TERM_KEYS = 32
+_TERM_KEYS = tuple((f'val-base-{i}', f'fld-base-{i}', f'bln-base-{i}') for i in range(_CACHED_TERM_KEYS))
+
+# Full configs already built, keyed by (config path, modification time)
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load simplified configuration from a JSON file and convert to full config.
     
+    The result is cached until the file's modification time changes, so the
+    returned dict is shared between calls and should be copied before mutating.
+    
     Args:
         config_path: Path to the configuration file
         
     Returns:
         Dict containing the full configuration
     """
+    cache_key = (os.fspath(config_path), os.path.getmtime(config_path))
+    if cache_key in _CONFIG_CACHE:
+        return _CONFIG_CACHE[cache_key]
+    
     with open(config_path, 'r', encoding='utf-8') as f:
         simple_config = json.load(f)
     
@@ -35,6 +57,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
         'query_params': build_query_params(simple_config)
     }
     
+    _CONFIG_CACHE[cache_key] = full_config
     return full_config
 
 def build_query_params(config: Dict[str, Any]) -> Dict[str, str]:
@@ -47,11 +70,11 @@ def build_query_params(config: Dict[str, Any]) -> Dict[str, str]:
     Returns:
         Dict of query parameters for the NewsBank API
     """
-    # Start with standard parameters
-    params = STANDARD_PARAMS.copy()
-    
-    # Add hide duplicates parameter
-    params['hide_duplicates'] = "2" if config.get('hide_duplicates', True) else "0"
+    # Start with standard parameters and the hide duplicates parameter
+    params = {
+        **STANDARD_PARAMS,
+        'hide_duplicates': "2" if config.get('hide_duplicates', True) else "0",
+    }
     
     # Add location parameters
     location = config.get('location', {})
@@ -78,12 +101,16 @@ def build_query_params(config: Dict[str, Any]) -> Dict[str, str]:
         
         # Add each query term and field
         for i, (term, field) in enumerate(zip(query_terms, field_terms)):
-            params[f'val-base-{i}'] = term['value']
-            params[f'fld-base-{i}'] = field
+            if i < _CACHED_TERM_KEYS:
+                val_key, fld_key, bln_key = _TERM_KEYS[i]
+            else:
+                val_key, fld_key, bln_key = f'val-base-{i}', f'fld-base-{i}', f'bln-base-{i}'
+            params[val_key] = term['value']
+            params[fld_key] = field
             
             # Add boolean operator if not first term
             if i > 0:
-                params[f'bln-base-{i}'] = term['operator'].lower()
+                params[bln_key] = term['operator'].lower()
     
     # Add max results per page
     params['maxresults'] = str(config.get('max_results_per_page', 60))
@@ -100,31 +127,28 @@ def parse_query_string(query_string: str) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries with 'value' and 'operator' keys
     """
-    # Split the query string to separate terms and operators
+    # Splitting on the operators gives [term0, op1, term1, op2, term2, ...]
     # This is a simplified version - a more robust parser would be needed for complex queries
-    terms = []
-    parts = query_string.split()
-    
-    current_term = ""
-    current_operator = "AND"  # Default operator
-    
-    for part in parts:
-        if part.upper() in ("AND", "OR"):
-            if current_term:  # Add the previous term if it exists
-                terms.append({"value": current_term.strip(), "operator": current_operator})
-                current_term = ""
-            current_operator = part.upper()
-        else:
-            if current_term:
-                current_term += " " + part
-            else:
-                current_term = part
-    
-    # Add the last term
-    if current_term:
-        terms.append({"value": current_term.strip(), "operator": current_operator})
+    parts = _OPERATOR_SPLIT_RE.split(query_string)
+    operators = ["AND"] + [operator.upper() for operator in parts[1::2]]
+    
+    return [
+        {"value": " ".join(value.split()), "operator": operator}
+        for value, operator in zip(parts[0::2], operators)
+        if value.strip()
+    ]
+
+def _fast_quote(value: str) -> str:
+    """
+    Percent-encode a string the same way urllib.parse.quote does, via a byte lookup table.
     
-    return terms
+    Args:
+        value: String to encode
+        
+    Returns:
+        Percent-encoded string
+    """
+    return ''.join([_QUOTE_TABLE[b] for b in value.encode('utf-8')])
 
 def build_location_filter(location: Dict[str, str]) -> str:
     """
@@ -136,32 +160,26 @@ def build_location_filter(location: Dict[str, str]) -> str:
     Returns:
         Location filter string
     """
-    filter_parts = []
-    
-    # Add country filter
+    # Country filter (optional)
     country = location.get('country', '')
-    if country:
-        country_encoded = urllib.parse.quote(country)
-        filter_parts.append(f"country:{country}!{country_encoded}")
+    country_filter = f"country:{country}!{_fast_quote(country)}/" if country else ""
     
-    # Add source type filter (hardcoded for now)
-    filter_parts.append("stp:Newspaper|Web-Only+Source!Multiple Source Types (2)")
-    
-    
-    # Add continent filter (hardcoded for North America)
-    filter_parts.append("continent:North+America!North+America")
-    
-    # Add city and state filter
+    # City and state filter (optional)
     city = location.get('city', '')
     state = location.get('state', '')
     if city and state:
         city_state = f"{city} ({state})"
-        city_state_encoded = urllib.parse.quote(city_state)
-        filter_parts.append(f"city:{city_state}!{city_state_encoded}")
-    
-    # Add language filter
-    filter_parts.append("language:English!English")
-    
-    # Join all filter parts with slash
-    print('/'.join(filter_parts))
-    return '/'.join(filter_parts)
+        city_filter = f"city:{city_state}!{_fast_quote(city_state)}/"
+    else:
+        city_filter = ""
+    
+    # Slash-separated filters; source type, continent (North America) and language are hardcoded for now
+    location_filter = (
+        f"{country_filter}"
+        "stp:Newspaper|Web-Only+Source!Multiple Source Types (2)/"
+        "continent:North+America!North+America/"
+        f"{city_filter}"
+        "language:English!English"
+    )
+    logger.debug(f"Location filter: {location_filter}")
+    return location_filter
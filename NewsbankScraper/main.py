@@ -11,6 +11,16 @@ import logging
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
+
+try:
+    from uvloop import run as uvloop_run  # uvloop 0.18+
+except ImportError:  # Optional and not available on Windows: falls back to the asyncio event loop
+    uvloop_run = None
+
 from NewsbankScraper.config import load_config
 from NewsbankScraper.scraper import NewsBankScraper
 
@@ -32,7 +42,8 @@ def parse_args():
         "-c", "--config", required=True, help="Path to JSON config file with search parameters"
     )
     parser.add_argument(
-        "-o", "--output", required=True, help="Path to save the scraped results as JSON"
+        "-o", "--output", required=True,
+        help="Path to save the scraped results as JSON, or as JSON Lines if it ends in .jsonl"
     )
     parser.add_argument(
         "-d", "--debug", action="store_true", help="Enable debug logging"
@@ -46,7 +57,7 @@ def parse_args():
     )
     parser.add_argument(
         "-r", "--rate", type=float, default= 0.3,
-        help="Rate limit in seconds between requests (default: 1.0)"
+        help="Allow CONCURRENCY requests to start per RATE seconds, in bursts of up to CONCURRENCY (default: 0.3)"
     )
     parser.add_argument(
         "-n", "--concurrency", type=int, default=10,
@@ -54,7 +65,7 @@ def parse_args():
     )
     parser.add_argument(
         "-p", "--processors", type=int, default=None,
-        help="Number of CPU processors to use for parsing (default: half of available cores)"
+        help="Number of parser worker threads to use (default: number of available cores)"
     )
 
     parser.add_argument(
@@ -95,9 +106,14 @@ async def main():
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save the JSON file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(articles, f, indent=2, ensure_ascii=False)
+    # Save the JSON file, or one article per line for .jsonl output
+    if output_path.suffix == '.jsonl':
+        NewsBankScraper.dump_articles(articles, output_path)
+    elif orjson is not None:
+        output_path.write_bytes(orjson.dumps(articles, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(articles, f, indent=2, ensure_ascii=False)
 
     logger.info(f"Results saved to {output_path}")
     
@@ -105,4 +121,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    sys.exit(uvloop_run(main()) if uvloop_run is not None else asyncio.run(main()))
\ No newline at end of file
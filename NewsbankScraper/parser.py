@@ -1,85 +1,390 @@
 """
 Parser class for NewsBank scraper.
-Handles extracting data from HTML using multiprocessing for performance.
+Handles extracting data from HTML on a pool of worker threads for performance.
 """
 
+import asyncio
+import json
 import logging
+import os
 import re
-from datetime import datetime
-from functools import lru_cache
-from typing import Dict, List, Any, Optional
-import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+import sys
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
-from newspaper import Article
+from lxml import etree
+from lxml import html as lxml_html
+from newspaper import Article, Config
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-# Define standalone functions for multiprocessing (must be at module level)
-@lru_cache(maxsize=100)
-def parse_html(html: str) -> BeautifulSoup:
+def _has_class(class_name: str) -> str:
+    """Build an XPath predicate matching a single CSS class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# XPath expressions for the search results page, compiled once at import
+_ARTICLE_XP = etree.XPath(f"//article[{_has_class('search-hits__hit')}]")
+_ARTICLE_DIV_XP = etree.XPath(f"//div[{_has_class('search-hits__hit')}]")
+_TOTAL_HITS_XP = etree.XPath(
+    f"(//*[{_has_class('search-hits__meta--total_hits')} or {_has_class('search-hitsmeta--total_hits')}])[1]"
+)
+_ANY_HIT_XP = etree.XPath(f"//*[{_has_class('search-hits__hit')}]")
+_META_ITEMS_XP = etree.XPath(f".//*[{_has_class('search-hits__hit__meta')}]//li")
+_LD_JSON_XP = etree.XPath("//script[@type='application/ld+json']/text()", smart_strings=False)
+
+# Search pages handed to a worker per task when parsing many pages at once
+SEARCH_PAGE_BATCH_SIZE = 8
+
+# Class names of the article body containers tried before falling back to newspaper3k
+_BODY_CLASSES = ('document-view__body', 'document-body', 'article-body')
+_BODY_XPS = tuple(etree.XPath(f"(//*[{_has_class(body_class)}])[1]") for body_class in _BODY_CLASSES)
+
+# Per-thread lxml parsers. A parser is locked while it parses, so threads sharing
+# one (including lxml.html's module default) would take turns instead of running
+# in parallel.
+_thread_state = threading.local()
+
+# Shared newspaper3k config for the fallback: we only want the text, not images or a seen-article cache
+_NP_CONFIG = Config()
+_NP_CONFIG.fetch_images = False
+_NP_CONFIG.memoize_articles = False
+
+# Month numbers by name, for parsing NewsBank dates without strptime
+_MONTHS = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
+    'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
+}
+
+# Regular expressions used on every page/article, compiled once at import
+_HITS_RE = re.compile(r'([\d,]+)')
+# Count at the start of the total hits element, matched on the raw page bytes
+_TOTAL_RE = re.compile(
+    rb'class="(?:[^"]*\s)?search-hits_?_meta--total_hits(?:\s[^"]*)?"[^>]*>\s*(\d[\d,]*)'
+)
+_DATE_RE = re.compile(r'^[A-Z][a-z]+ \d{1,2}, \d{4}$')
+_DOCREF_RE = re.compile(r'[?&]docref=([^&#]+)')
+
+# JSON-LD types describing a search hit
+_LD_ARTICLE_TYPES = frozenset({'NewsArticle', 'Article', 'ReportageNewsArticle'})
+
+
+def _scan_article(article_elem) -> Tuple[Any, Any, Any, Any]:
+    """
+    Find the title link and metadata items of a search hit in a single walk.
+    
+    Follows the same priority as the individual selectors did: the title prefers
+    a link under .search-hits__hit__title, then under h3.search-hits__title, then
+    any document-view link; date, source and author take the first element with
+    the matching meta item class (or an li whose class mentions the field).
+    
+    Args:
+        article_elem: Search hit element
+        
+    Returns:
+        Tuple of (title, date, source, author) elements, None where not found
+    """
+    titles = [None, None, None]
+    date_elem = source_elem = author_elem = None
+    
+    for elem in article_elem.iterdescendants(etree.Element):
+        tag = elem.tag
+        if tag == 'a' and titles[2] is None and 'document-view' in elem.get('href', ''):
+            titles[2] = elem
+        
+        item_class = elem.get('class')
+        if not item_class:
+            continue
+        classes = item_class.split()
+        
+        if titles[0] is None and 'search-hits__hit__title' in classes:
+            titles[0] = next(elem.iterdescendants('a'), None)
+        if titles[1] is None and tag == 'h3' and 'search-hits__title' in classes:
+            titles[1] = next(elem.iterdescendants('a'), None)
+        
+        is_li = tag == 'li'
+        if date_elem is None and ('search-hits__hit__meta__item--display-date' in classes
+                                  or (is_li and 'date' in item_class)):
+            date_elem = elem
+        if source_elem is None and ('search-hits__hit__meta__item--source' in classes
+                                    or (is_li and 'source' in item_class)):
+            source_elem = elem
+        if author_elem is None and ('search-hits__hit__meta__item--author' in classes
+                                    or (is_li and 'author' in item_class)):
+            author_elem = elem
+        
+        # Everything found with the highest-priority title: nothing left to look for
+        if titles[0] is not None and date_elem is not None and source_elem is not None and author_elem is not None:
+            break
+    
+    title_elem = next((elem for elem in titles if elem is not None), None)
+    return title_elem, date_elem, source_elem, author_elem
+
+
+def _node_text(elem) -> str:
+    """Get the stripped text of an element (same as BeautifulSoup's get_text(strip=True))."""
+    return ''.join(text.strip() for text in elem.itertext())
+
+
+# Standalone parse functions, run on the parser's worker threads
+def _thread_parser(encoding: Optional[str] = None) -> lxml_html.HTMLParser:
     """
-    Parse HTML with caching for better performance.
+    Get the calling thread's lxml parser for an encoding, creating it on first use.
     
     Args:
-        html: HTML string to parse
+        encoding: Encoding to read bytes as, or None to follow the document's own declaration
         
     Returns:
-        BeautifulSoup object
+        HTML parser owned by the calling thread
+        
+    Raises:
+        LookupError: If lxml doesn't know the encoding
+    """
+    parsers = getattr(_thread_state, 'parsers', None)
+    if parsers is None:
+        parsers = _thread_state.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml_html.HTMLParser(encoding=encoding)
+    return parser
+
+
+def _worker_init():
+    """
+    Warm up a worker thread before it receives any pages.
+    
+    Parsing a tiny document creates the thread's lxml parsers and sets up their
+    state, so the first real page doesn't pay for it.
+    """
+    _thread_parser('utf-8')
+    lxml_html.fromstring('<html><body></body></html>', parser=_thread_parser())
+
+
+def parse_html(html: Union[bytes, str], charset: Optional[str] = None):
+    """
+    Parse HTML into an lxml tree.
+    
+    Not cached: each page is parsed once, and keying a cache on the full HTML
+    string costs a hash of the whole page per call and pins large trees in memory.
+    
+    Bytes are handed to lxml undecoded. A charset from the HTTP Content-Type
+    header takes precedence, as it did when responses were decoded before
+    parsing; otherwise lxml reads the page's own charset declaration, and pages
+    without one in their first 1024 bytes (where HTML requires it) are read as UTF-8.
+    
+    Args:
+        html: HTML to parse, as received (bytes) or decoded (str)
+        charset: Charset declared by the response's Content-Type header, if any
+        
+    Returns:
+        Root element of the parsed document
     """
-    return BeautifulSoup(html, 'lxml')
+    if isinstance(html, bytes):
+        if charset:
+            try:
+                return lxml_html.fromstring(html, parser=_thread_parser(charset))
+            except LookupError:
+                # A name Python knows but lxml doesn't (e.g. "latin-1"): decode here instead
+                try:
+                    html = html.decode(charset, errors='replace')
+                except LookupError:
+                    # Not a real charset after all, so treat the header as missing
+                    pass
+        if isinstance(html, bytes) and b'charset' not in html[:1024]:
+            return lxml_html.fromstring(html, parser=_thread_parser('utf-8'))
+    return lxml_html.fromstring(html, parser=_thread_parser())
 
 
-def extract_total_results_mp(html: str) -> int:
+def extract_total_results_mp(html: Union[bytes, str], charset: Optional[str] = None) -> int:
     """
-    Standalone function to extract total results (for multiprocessing).
+    Standalone function to extract total results (run on the worker threads).
     
     Args:
         html: HTML content of the search page
+        charset: Charset declared by the response's Content-Type header, if any
         
     Returns:
         Total number of results as an integer
     """
-    soup = parse_html(html)
+    # The count is usually the first text in its element, so try to read it
+    # straight from the bytes before building a tree for the whole page
+    if isinstance(html, bytes):
+        total_match = _TOTAL_RE.search(html)
+        if total_match:
+            return int(total_match.group(1).replace(b',', b''))
+    
+    tree = parse_html(html, charset)
     
     # Get total hits from the results element
-    hits_div = soup.select_one('.search-hits__meta--total_hits, .search-hitsmeta--total_hits')
+    hits_divs = _TOTAL_HITS_XP(tree)
     
-    if hits_div:
-        hits_text = hits_div.get_text(strip=True)
-        hits_match = re.search(r'([\d,]+)', hits_text)
+    if hits_divs:
+        hits_text = _node_text(hits_divs[0])
+        hits_match = _HITS_RE.search(hits_text)
         if hits_match:
             # Remove commas from number (e.g., "1,022" -> "1022")
             return int(hits_match.group(1).replace(',', ''))
     
     # Fallback: count articles on the page and assume there are more
-    articles = soup.select('article.search-hits__hit, .search-hits__hit')
+    articles = _ANY_HIT_XP(tree)
     if articles:
         return len(articles) * 5  # Assume at least 5 pages
     
     return 0
 
 
-def extract_articles_mp(html: str) -> List[Dict[str, Any]]:
+def _ld_name(value: Any) -> str:
+    """Get the display name(s) of a JSON-LD person/organization value (dict, string or list of either)."""
+    if isinstance(value, list):
+        return ', '.join(filter(None, (_ld_name(item) for item in value)))
+    if isinstance(value, dict):
+        value = value.get('name', '')
+    return value.strip() if isinstance(value, str) else ''
+
+
+def _ld_json_articles(html: Union[bytes, str], tree) -> Optional[List[Dict[str, Any]]]:
     """
-    Standalone function to extract articles (for multiprocessing).
+    Read article previews from JSON-LD metadata embedded in a search page.
     
     Args:
         html: HTML content of the search page
+        tree: Parsed search page
+        
+    Returns:
+        List of article preview dictionaries, or None if the page has no usable
+        JSON-LD and has to be scraped from its markup instead
+    """
+    # Most pages have no JSON-LD at all, so don't search the tree for it unless it's there
+    marker = b'application/ld+json' if isinstance(html, bytes) else 'application/ld+json'
+    if marker not in html:
+        return None
+    
+    # Collect the article objects, which may be top level, in an @graph or in an ItemList
+    nodes = []
+    for block in _LD_JSON_XP(tree):
+        try:
+            data = orjson.loads(block) if orjson is not None else json.loads(block)
+        except ValueError:
+            continue
+        nodes.extend(data if isinstance(data, list) else [data])
+    
+    ld_articles = []
+    while nodes:
+        node = nodes.pop(0)
+        if not isinstance(node, dict):
+            continue
+        # @type is usually a string or a list of them; ignore anything else (e.g. nested objects)
+        node_type = node.get('@type')
+        types = {t for t in (node_type if isinstance(node_type, list) else [node_type]) if isinstance(t, str)}
+        if types & _LD_ARTICLE_TYPES:
+            ld_articles.append(node)
+        elif '@graph' in node:
+            nodes[:0] = node['@graph'] if isinstance(node['@graph'], list) else [node['@graph']]
+        elif 'ItemList' in types:
+            items = node.get('itemListElement') or []
+            nodes[:0] = [item.get('item', item) if isinstance(item, dict) else item for item in items]
+    
+    if not ld_articles:
+        return None
+    
+    articles = []
+    for node in ld_articles:
+        title = _ld_name(node.get('headline') or node.get('name'))
+        url = node.get('url') or node.get('@id')
+        date_published = node.get('datePublished')
+        source = _ld_name(node.get('publisher') or node.get('isPartOf'))
+        
+        # Only trust JSON-LD that has every required field for every article
+        if not (title and isinstance(url, str) and isinstance(date_published, str) and source):
+            return None
+        
+        identifier = node.get('identifier')
+        if not isinstance(identifier, str):
+            docref_match = _DOCREF_RE.search(url)
+            identifier = unquote(docref_match.group(1)) if docref_match else ''
+        
+        articles.append({
+            'article_id': identifier,
+            'title': title,
+            'article_url': url,
+            'date': date_published,
+            'source': sys.intern(source),
+            'author': sys.intern(_ld_name(node.get('author'))),
+        })
+    
+    return articles
+
+
+def _match_ld_json_to_hits(ld_articles: List[Dict[str, Any]], article_elements) -> Optional[List[Dict[str, Any]]]:
+    """
+    Pair JSON-LD article previews with the search hits on the page by docref.
+    
+    Args:
+        ld_articles: Previews read from the page's JSON-LD
+        article_elements: Search hit elements found in the page markup
+        
+    Returns:
+        The previews in the order of the hits, or None unless every hit has exactly
+        one preview whose URL carries its docref
+    """
+    if len(ld_articles) != len(article_elements):
+        return None
+    
+    by_docref = {}
+    for article in ld_articles:
+        docref_match = _DOCREF_RE.search(article['article_url'])
+        if docref_match:
+            by_docref[unquote(docref_match.group(1))] = article
+    
+    matched_articles = []
+    for article_elem in article_elements:
+        docref = article_elem.get('data-docref', '')
+        article = by_docref.pop(docref, None)
+        if article is None:
+            return None
+        article['article_id'] = docref
+        matched_articles.append(article)
+    
+    return matched_articles
+
+
+def extract_articles_mp(html: Union[bytes, str], charset: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Standalone function to extract articles (run on the worker threads).
+    
+    Args:
+        html: HTML content of the search page
+        charset: Charset declared by the response's Content-Type header, if any
         
     Returns:
         List of article preview dictionaries
     """
-    soup = parse_html(html)
+    tree = parse_html(html, charset)
     articles = []
     
     # Find all article elements - need to try multiple selectors
-    article_elements = soup.select('article.search-hits__hit')
+    article_elements = _ARTICLE_XP(tree)
     if not article_elements:
         # If first selector fails, try a more generic one
-        article_elements = soup.select('div.search-hits__hit')
+        article_elements = _ARTICLE_DIV_XP(tree)
+    
+    # Structured metadata, when the page embeds it, saves scraping each hit's markup.
+    # It is only used when it describes exactly the hits on the page; anything else
+    # (e.g. an unrelated NewsArticle in <head>) would silently replace results.
+    ld_articles = _ld_json_articles(html, tree)
+    if ld_articles is not None:
+        matched_articles = _match_ld_json_to_hits(ld_articles, article_elements)
+        if matched_articles is not None:
+            return matched_articles
     
     if not article_elements:
         # If we still can't find any articles, raise an error
@@ -89,48 +394,43 @@ def extract_articles_mp(html: str) -> List[Dict[str, Any]]:
         # Extract article ID
         article_id = article_elem.get('data-docref', '')
         
-        # We need to try multiple selectors for title since the HTML structure varies
-        title_elem = None
-        for selector in ['.search-hits__hit__title a', 'h3.search-hits__title a', 'a[href*="document-view"]']:
-            title_elem = article_elem.select_one(selector)
-            if title_elem:
-                break
+        # Find the title link and metadata items in one pass over the article
+        title_elem, date_elem, source_elem, author_elem = _scan_article(article_elem)
                 
-        if not title_elem:
+        if title_elem is None:
             raise ValueError(f"Could not find title element for article: {article_id}")
             
-        title = title_elem.get_text(strip=True)
+        title = _node_text(title_elem)
         # Remove "Go to the document viewer for " prefix if present
         if "Go to the document viewer for" in title:
             title = title.replace("Go to the document viewer for", "").strip()
         
         url = title_elem.get('href')
         
-        # Try multiple selectors for metadata items
-        date_elem = article_elem.select_one('.search-hits__hit__meta__item--display-date, li[class*="date"]')
-        source_elem = article_elem.select_one('.search-hits__hit__meta__item--source, li[class*="source"]')
-        author_elem = article_elem.select_one('.search-hits__hit__meta__item--author, li[class*="author"]')
-        
-        if not date_elem or not source_elem:
+        if date_elem is None or source_elem is None:
             # Look for metadata list items if we couldn't find with specific selectors
-            meta_items = article_elem.select('.search-hits__hit__meta li, ul.search-hits__hit__meta li')
-            for item in meta_items:
-                item_text = item.get_text(strip=True)
-                item_class = ' '.join(item.get('class', []))
+            for item in _META_ITEMS_XP(article_elem):
+                item_class = item.get('class', '')
                 
-                if not date_elem and ('date' in item_class or re.match(r'^[A-Z][a-z]+ \d{1,2}, \d{4}$', item_text)):
+                # Date first, by class or by its text, whatever else the class says
+                if date_elem is None and ('date' in item_class or _DATE_RE.match(_node_text(item))):
                     date_elem = item
-                elif not source_elem and ('source' in item_class):
+                elif source_elem is None and 'source' in item_class:
                     source_elem = item
-                elif not author_elem and ('author' in item_class):
+                elif author_elem is None and 'author' in item_class:
                     author_elem = item
+                
+                if date_elem is not None and source_elem is not None and author_elem is not None:
+                    break
         
-        if not date_elem or not source_elem:
+        if date_elem is None or source_elem is None:
             raise ValueError(f"Missing required metadata for article: {article_id}")
             
-        date = date_elem.get_text(strip=True)
-        source = source_elem.get_text(strip=True)
-        author = author_elem.get_text(strip=True) if author_elem else ""
+        date = _node_text(date_elem)
+        # Few distinct sources and authors repeat across thousands of articles, so
+        # interning them keeps one copy of each string alive
+        source = sys.intern(_node_text(source_elem))
+        author = sys.intern(_node_text(author_elem)) if author_elem is not None else ""
         
         # Add to articles list
         articles.append({
@@ -145,31 +445,56 @@ def extract_articles_mp(html: str) -> List[Dict[str, Any]]:
     return articles
 
 
-def extract_article_text_mp(html: str) -> str:
+def extract_articles_batch_mp(pages: List[Union[bytes, str]],
+                              charsets: Optional[List[Optional[str]]] = None) -> List[List[Dict[str, Any]]]:
     """
-    Standalone function to extract article text (for multiprocessing).
+    Standalone function to extract articles from several search pages in one task.
+    
+    Args:
+        pages: HTML content of the search pages
+        charsets: Charset from each page's Content-Type header (None where absent)
+        
+    Returns:
+        List of article preview lists, one per page, in the same order
+    """
+    if charsets is None:
+        charsets = [None] * len(pages)
+    return [extract_articles_mp(html, charset) for html, charset in zip(pages, charsets)]
+
+
+def extract_article_text_mp(html: Union[bytes, str], charset: Optional[str] = None) -> str:
+    """
+    Standalone function to extract article text (run on the worker threads).
     
     Args:
         html: HTML content of the article page
+        charset: Charset declared by the response's Content-Type header, if any
         
     Returns:
         Article text as a string
     """
-    soup = parse_html(html)
+    tree = parse_html(html, charset)
     
     # Get the main content using multiple possible selectors
     content_elem = None
-    for selector in ['.document-view__body', '.document-body', '.article-body']:
-        content_elem = soup.select_one(selector)
-        if content_elem:
+    for body_xp in _BODY_XPS:
+        content_elems = body_xp(tree)
+        if content_elems:
+            content_elem = content_elems[0]
             break
     
-    # If we found content directly, return it
-    if content_elem:
-        return content_elem.get_text(strip=True)
+    # If we found content directly, return it (without any inline script or style text)
+    if content_elem is not None:
+        etree.strip_elements(content_elem, 'script', 'style', with_tail=False)
+        return _node_text(content_elem)
     
-    # Otherwise use newspaper3k
-    article = Article('')
+    # Otherwise use newspaper3k, decoding first if the response told us how
+    if isinstance(html, bytes) and charset:
+        try:
+            html = html.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    article = Article('', config=_NP_CONFIG)
     article.set_html(html)
     article.parse()
     
@@ -181,92 +506,112 @@ def extract_article_text_mp(html: str) -> str:
 
 
 class NewsBankParser:
-    """Class to handle parsing of NewsBank HTML content with multiprocessing"""
+    """Class to handle parsing of NewsBank HTML content on a thread pool"""
     
     def __init__(self, num_workers: Optional[int] = None):
         """
-        Initialize the parser with a process pool.
+        Initialize the parser with a thread pool.
+        
+        lxml releases the GIL while it parses, so worker threads parse pages in
+        parallel without pickling them to and from worker processes.
         
         Args:
-            num_workers: Number of worker processes to use (default: half of available cores)
+            num_workers: Number of worker threads to use (default: number of available cores)
         """
-        self.num_workers = num_workers or max(multiprocessing.cpu_count() // 2, 1)
-        self.process_pool = None
+        # Threads are cheap next to worker processes, so there is one per core by default
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.pool = None
         logger.info(f"Initialized parser with {self.num_workers} workers")
         
-        # Start the process pool immediately
+        # Start the thread pool immediately
         self.start()
     
     def start(self):
-        """Start the process pool if not already running"""
-        if self.process_pool is None:
-            self.process_pool = ProcessPoolExecutor(max_workers=self.num_workers)
-            logger.debug(f"Started process pool with {self.num_workers} workers")
+        """Start the thread pool if not already running"""
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=self.num_workers, initializer=_worker_init)
+            logger.debug(f"Started thread pool with {self.num_workers} workers")
     
     def shutdown(self):
-        """Shutdown the process pool if running"""
-        if self.process_pool:
-            self.process_pool.shutdown()
-            self.process_pool = None
-            logger.debug("Shut down process pool")
+        """Shutdown the thread pool if running"""
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+            logger.debug("Shut down thread pool")
     
-    async def get_total_results(self, html: str) -> int:
+    async def _run(self, func, *args):
         """
-        Get the total number of search results using the process pool.
+        Run a parse function on the thread pool without blocking the event loop.
         
         Args:
-            html: HTML content of the search page
+            func: Module-level parse function
+            *args: Arguments for the parse function
             
         Returns:
-            Total number of results as an integer
+            Whatever the parse function returns
         """
-        # Ensure process pool is started
+        # Ensure thread pool is started
         self.start()
         
-        # Direct synchronous execution for simplicity and reliability
-        if True:  # Set to False to use process pool
-            # Direct execution without process pool
-            return extract_total_results_mp(html)
-        else:
-            # Process pool execution
-            future = self.process_pool.submit(extract_total_results_mp, html)
-            return future.result()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, func, *args)
     
-    async def extract_articles_from_search_page(self, html: str) -> List[Dict[str, Any]]:
+    async def get_total_results(self, html: Union[bytes, str], charset: Optional[str] = None) -> int:
         """
-        Extract article data from search results page using the process pool.
+        Get the total number of search results using the thread pool.
         
         Args:
             html: HTML content of the search page
+            charset: Charset declared by the response's Content-Type header, if any
+            
+        Returns:
+            Total number of results as an integer
+        """
+        return await self._run(extract_total_results_mp, html, charset)
+    
+    async def extract_articles_from_search_page(self, html: Union[bytes, str],
+                                                charset: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Extract article data from search results page using the thread pool.
+        
+        Args:
+            html: HTML content of the search page
+            charset: Charset declared by the response's Content-Type header, if any
             
         Returns:
             List of article preview dictionaries
         """
-        # Ensure process pool is started
-        self.start()
+        return await self._run(extract_articles_mp, html, charset)
+    
+    async def extract_articles_from_search_pages(self, pages: List[Union[bytes, str]],
+                                                 charsets: Optional[List[Optional[str]]] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Extract article data from several search results pages as a single thread pool task.
+        
+        Sending pages in batches means one task and one event loop round trip per
+        batch rather than per page; see SEARCH_PAGE_BATCH_SIZE.
         
-        # Submit the task to the process pool
-        future = self.process_pool.submit(extract_articles_mp, html)
-        # Wait for the result
-        return future.result()
+        Args:
+            pages: HTML content of the search pages
+            charsets: Charset from each page's Content-Type header (None where absent)
+            
+        Returns:
+            List of article preview lists, one per page, in the same order as pages
+        """
+        return await self._run(extract_articles_batch_mp, pages, charsets)
     
-    async def extract_article_text(self, html: str) -> str:
+    async def extract_article_text(self, html: Union[bytes, str], charset: Optional[str] = None) -> str:
         """
-        Extract article text from article page using the process pool.
+        Extract article text from article page using the thread pool.
         
         Args:
             html: HTML content of the article page
+            charset: Charset declared by the response's Content-Type header, if any
             
         Returns:
             Article text as a string
         """
-        # Ensure process pool is started
-        self.start()
-        
-        # Submit the task to the process pool
-        future = self.process_pool.submit(extract_article_text_mp, html)
-        # Wait for the result
-        return future.result()
+        return await self._run(extract_article_text_mp, html, charset)
     
     @staticmethod
     def convert_date_to_iso(date_str: str) -> str:
@@ -274,11 +619,27 @@ class NewsBankParser:
         Convert date string to ISO format (YYYY-MM-DD).
         
         Args:
-            date_str: Date string from the article (e.g., "November 29, 2024")
+            date_str: Date string from the article (e.g., "November 29, 2024"), or an
+                ISO 8601 date/datetime as found in JSON-LD metadata
             
         Returns:
             Date in ISO format (e.g., "2024-11-29")
         """
+        if date_str[:4].isdigit():
+            return date.fromisoformat(date_str[:10]).isoformat()
+        
         # NewsBank dates are in format: "Month DD, YYYY" (e.g., "November 29, 2024")
+        # Only the exact canonical shape takes the fast path: int() and date() accept
+        # things strptime rejects (short years, signs, stray spaces, non-ASCII digits)
+        month, _, rest = date_str.partition(' ')
+        day, _, year = rest.partition(', ')
+        if (month in _MONTHS and len(day) <= 2 and day.isdigit() and day.isascii()
+                and len(year) == 4 and year.isdigit() and year.isascii()):
+            try:
+                return date(int(year), _MONTHS[month], int(day)).isoformat()
+            except ValueError:
+                pass
+        
+        # Anything unusual (lowercase month, odd spacing, ...) goes through strptime
         parsed_date = datetime.strptime(date_str, '%B %d, %Y')
         return parsed_date.strftime('%Y-%m-%d')
\ No newline at end of file
@@ -4,44 +4,167 @@ Handles the high-level scraping process.
 """
 
 import asyncio
+import itertools
+import json
 import logging
 import math
+import random
 import re
+import ssl
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from urllib.parse import urlparse, urljoin
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
+from urllib.parse import urlencode, urlparse, urljoin
 
 import aiohttp
-from bs4 import BeautifulSoup
 from tqdm import tqdm
-from tqdm.asyncio import tqdm as async_tqdm
 
-from NewsbankScraper.parser import NewsBankParser
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
+
+from NewsbankScraper.parser import NewsBankParser, SEARCH_PAGE_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Location parts of the 't' filter parameter built by config.build_location_filter
+_COUNTRY_RE = re.compile(r'country:([^!]+)!')
+_CITY_STATE_RE = re.compile(r'city:([^!]+)!')
+_STATE_RE = re.compile(r'(.+)\s+\(([A-Z]{2})\)')
+
+# Minimum seconds between progress bar redraws, to keep terminal writes off the hot path
+PROGRESS_INTERVAL = 0.5
+
+# Responses that are retried with exponential backoff rather than failing the request
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+RETRY_JITTER = 1.0
+
+# Responses larger than this, or that aren't HTML, are rejected rather than read into memory
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+HTML_CONTENT_TYPES = frozenset({'text/html', 'application/xhtml+xml'})
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseRejected(ValueError):
+    """Raised when a response is refused unread because of its content type or size"""
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header, given either as seconds or as an HTTP date.
+    
+    Args:
+        value: Header value, or None if the header was not sent
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Token bucket limiting how many requests can start per time period"""
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        Initialize the limiter with a full bucket.
+        
+        Args:
+            max_rate: Number of acquisitions allowed per time period (also the burst size)
+            time_period: Length of the time period in seconds (0 disables limiting)
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._last_refill = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        if self.time_period <= 0:
+            return
+        
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._last_refill is not None:
+                    elapsed = now - self._last_refill
+                    self._tokens = min(self.max_rate, self._tokens + elapsed * self.max_rate / self.time_period)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                # Sleep only as long as it takes for the next token to arrive
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 class NewsBankScraper:
     """NewsBank scraper main class"""
     
     def __init__(self, config: Dict[str, Any], rate_limit: float = 1.0, save_html: bool = False, 
-                concurrency: int = 10, num_processors: Optional[int] = None, full_text = False):
+                concurrency: int = 10, num_processors: Optional[int] = None, full_text = False,
+                max_bytes: int = MAX_RESPONSE_BYTES):
         """
         Initialize the scraper.
         
         Args:
             config: Configuration dictionary
-            rate_limit: Rate limit in seconds between requests
+            rate_limit: Rate limit in seconds between requests (per concurrent request slot)
             save_html: Whether to save HTML responses for debugging
             concurrency: Maximum number of concurrent requests
-            num_processors: Number of CPU processors to use for parsing
+            num_processors: Number of parser worker threads to use
+            full_text: Whether to fetch the full text of each article
+            max_bytes: Largest response body to accept, in bytes
         """
         self.config = config
+        self.max_bytes = max_bytes
         self.rate_limit = rate_limit
         self.save_html = save_html
         self.session = None
+        self.concurrency = concurrency
         self.semaphore = asyncio.Semaphore(concurrency)  # Configurable concurrency
+        
+        # Shared limiter allowing `concurrency` requests per `rate_limit` seconds, the same
+        # ceiling as every slot waiting rate_limit, but without sleeping while holding a slot
+        self.limiter = RateLimiter(concurrency, rate_limit)
         self.full_text = full_text
         
+        # Search URL with the query encoded once from the config as passed in, so each
+        # page only appends pagination
+        self.search_url = f"{config['base_url']}?{urlencode(config['query_params'])}"
+        
+        # Base domain (scheme + netloc only) that relative article URLs are joined onto
+        parsed_base = urlparse(config.get('base_url', ''))
+        self._base_domain = f"{parsed_base.scheme}://{parsed_base.netloc}"
+        
         # Initialize parser
         self.parser = NewsBankParser(num_workers=num_processors)
         
@@ -56,8 +179,8 @@ class NewsBankScraper:
         t_param = self.config['query_params'].get('t', '')
         
         # Extract city, state and country from t parameter if available
-        country_match = re.search(r'country:([^!]+)!', t_param)
-        city_state_match = re.search(r'city:([^!]+)!', t_param)
+        country_match = _COUNTRY_RE.search(t_param)
+        city_state_match = _CITY_STATE_RE.search(t_param)
         
         if country_match:
             country = country_match.group(1)
@@ -69,7 +192,7 @@ class NewsBankScraper:
             city_state = city_state.replace('+', ' ')
             
             # Parse out city and state
-            state_match = re.search(r'(.+)\s+\(([A-Z]{2})\)', city_state)
+            state_match = _STATE_RE.search(city_state)
             if state_match:
                 location['city'] = state_match.group(1)
                 location['state'] = state_match.group(2)
@@ -81,9 +204,21 @@ class NewsBankScraper:
     async def _init_session(self):
         """Initialize HTTP session with cookies and headers"""
         if self.session is None:
+            # Everything goes to one host, so keep a pool of connections to it alive
+            # between requests instead of paying a new TCP/TLS handshake each time.
+            # New connections share one verifying SSL context and a cached DNS lookup.
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrency * 2,
+                limit_per_host=self.concurrency,
+                ssl=ssl.create_default_context(),
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                keepalive_timeout=75
+            )
             self.session = aiohttp.ClientSession(
                 headers=self.config['headers'],
-                cookies=self.config.get('cookies', {})
+                cookies=self.config.get('cookies', {}),
+                connector=connector
             )
     
     async def _close_session(self):
@@ -92,10 +227,10 @@ class NewsBankScraper:
             await self.session.close()
             self.session = None
         
-        # Shutdown the parser process pool
+        # Shutdown the parser thread pool
         self.parser.shutdown()
     
-    async def fetch_page(self, url: str, params: Dict[str, Any] = None) -> str:
+    async def fetch_page(self, url: str, params: Dict[str, Any] = None) -> Tuple[bytes, Optional[str]]:
         """
         Fetch a page with rate limiting.
         
@@ -104,15 +239,64 @@ class NewsBankScraper:
             params: Query parameters
             
         Returns:
-            Page content as string
+            Tuple of the raw page content, left undecoded for the parser, and the
+            charset from the response's Content-Type header (None if it has none)
         """
-        async with self.semaphore:
-            # Apply rate limiting
-            await asyncio.sleep(self.rate_limit)
+        for attempt in range(MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                # Apply rate limiting before taking a connection slot
+                async with self.limiter, self.semaphore:
+                    async with self.session.get(url, params=params) as response:
+                        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                            retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                        else:
+                            response.raise_for_status()
+                            return await self._read_html(response)
+            except asyncio.TimeoutError:
+                if attempt == MAX_RETRIES:
+                    raise
             
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                return await response.text()
+            # Back off outside the rate limiter and semaphore so other requests keep going.
+            # A server-requested wait is capped too, so a huge Retry-After can't stall the scrape.
+            if retry_after is None:
+                delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) + random.uniform(0, RETRY_JITTER)
+            else:
+                delay = min(retry_after, RETRY_MAX_DELAY)
+            logger.warning(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 1} of {MAX_RETRIES})")
+            await asyncio.sleep(delay)
+    
+    async def _read_html(self, response: aiohttp.ClientResponse) -> Tuple[bytes, Optional[str]]:
+        """
+        Read an HTML response body, refusing other content types and bodies over max_bytes.
+        
+        Args:
+            response: Response with a successful status
+            
+        Returns:
+            Tuple of the raw page content and the charset from its Content-Type header
+        """
+        if 'Content-Type' in response.headers and response.content_type not in HTML_CONTENT_TYPES:
+            raise ResponseRejected(f"Expected HTML from {response.url} but got {response.content_type}")
+        
+        # Content-Length is the size on the wire, which only matches the body's size when
+        # it isn't compressed, so it can reject a response early but never accept one
+        if 'Content-Encoding' not in response.headers and response.content_length is not None \
+                and response.content_length > self.max_bytes:
+            raise ResponseRejected(f"Response from {response.url} is {response.content_length} bytes, over the {self.max_bytes} byte limit")
+        
+        # The stream yields decompressed bytes, so the cap holds for gzip responses too
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            body += chunk
+            if len(body) > self.max_bytes:
+                raise ResponseRejected(f"Response from {response.url} is over the {self.max_bytes} byte limit")
+        return bytes(body), response.charset
+    
+    async def _save_debug_html(self, debug_path: Path, html: bytes):
+        """Write a debug copy of a page on the default executor so disk I/O doesn't block the event loop"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, debug_path.write_bytes, html)
     
     def get_absolute_url(self, relative_url: str) -> str:
         """
@@ -128,14 +312,15 @@ class NewsBankScraper:
         if relative_url.startswith('http'):
             return relative_url
         
-        # Get the base domain (scheme + netloc only)
-        parsed_base = urlparse(self.config.get('base_url', ''))
-        base_domain = f"{parsed_base.scheme}://{parsed_base.netloc}"
+        # NewsBank links are root-relative paths on the same host, which only need
+        # the base domain in front; anything else goes through urljoin
+        if relative_url.startswith('/') and not relative_url.startswith('//') and '/.' not in relative_url:
+            return self._base_domain + relative_url
         
         # Use urljoin to properly handle path joining
-        return urljoin(base_domain, relative_url)
+        return urljoin(self._base_domain, relative_url)
     
-    async def fetch_search_page(self, page_index: int = 0) -> str:
+    async def fetch_search_page(self, page_index: int = 0) -> Tuple[bytes, Optional[str]]:
         """
         Fetch a search results page.
         
@@ -143,49 +328,114 @@ class NewsBankScraper:
             page_index: Page index (0-based, where 0 is the first page)
             
         Returns:
-            Page content as string
+            Tuple of the raw page content and its Content-Type charset, as from fetch_page
         """
-        params = self.config['query_params'].copy()
-        
-        # Get or set default results per page
-        results_per_page = int(params.get('maxresults', '20'))
+        url = self.search_url
         
         # For pages after the first, add pagination parameters
         if page_index > 0:
-            # Add page parameter for pagination (0-based)
-            params['page'] = str(page_index)
-            
             # Calculate offset based on page number and results per page
+            results_per_page = int(self.config['query_params'].get('maxresults', '20'))
             offset = page_index * results_per_page
-            params['offset'] = str(offset)
             
-            # Ensure maxresults is set
-            params['maxresults'] = str(results_per_page)
+            # Page parameter is 0-based
+            url = f"{url}&page={page_index}&offset={offset}"
         
-        html = await self.fetch_page(self.config['base_url'], params)
+        html, charset = await self.fetch_page(url)
         
         # Save HTML for debugging if requested
         if self.save_html:
-            debug_path = Path(f"debug_response_page{page_index}.html")
-            with open(debug_path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            await self._save_debug_html(Path(f"debug_response_page{page_index}.html"), html)
             
-        return html
+        return html, charset
+    
+    async def _fetch_indexed_search_page(self, page_index: int) -> Tuple[int, bytes, Optional[str]]:
+        """Fetch a search results page, returning it alongside its page index"""
+        html, charset = await self.fetch_search_page(page_index)
+        return page_index, html, charset
+    
+    async def _parse_search_page_batch(self, batch: List[Tuple[int, bytes, Optional[str]]]) -> Dict[int, List[Dict[str, Any]]]:
+        """Parse (page index, HTML, charset) entries as a single parser task, returning article previews by page index"""
+        results = await self.parser.extract_articles_from_search_pages(
+            [html for _, html, _ in batch], [charset for _, _, charset in batch]
+        )
+        return {page_index: articles for (page_index, _, _), articles in zip(batch, results)}
     
     async def fetch_article_text(self, url: str) -> str:
-        """Fetch article page and extract the text"""
+        """Fetch article page and extract the text, or "" if the page was rejected unread"""
         absolute_url = self.get_absolute_url(url)
-        html = await self.fetch_page(absolute_url)
+        try:
+            html, charset = await self.fetch_page(absolute_url)
+        except ResponseRejected as e:
+            # A PDF link or an oversized page costs that one article's text, not the scrape
+            logger.warning(f"Skipping article text: {e}")
+            return ""
         
         # Save article HTML for debugging if requested
         if self.save_html:
             article_id = url.split("docref=")[-1].split("&")[0] if "docref=" in url else "unknown"
             safe_id = re.sub(r'[\\/*?:"<>|]', "_", article_id)
-            debug_path = Path(f"debug_article_{safe_id}.html")
-            with open(debug_path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            await self._save_debug_html(Path(f"debug_article_{safe_id}.html"), html)
         
-        return await self.parser.extract_article_text(html)
+        return await self.parser.extract_article_text(html, charset)
+    
+    async def _fetch_indexed_article_text(self, index: int, url: str) -> Tuple[int, str]:
+        """Fetch an article's text, returning it alongside the article's index"""
+        return index, await self.fetch_article_text(url)
+    
+    async def iter_article_texts(self, articles: List[Dict[str, Any]]) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Fetch the text of each article, keeping only a bounded window of fetches in flight.
+        
+        Args:
+            articles: Article previews with an 'article_url' key
+            
+        Yields:
+            (index, text) tuples in completion order, where index is the article's position in articles
+        """
+        window = self.concurrency * 2
+        pending = set()
+        try:
+            for index, article in enumerate(articles):
+                if len(pending) >= window:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(self._fetch_indexed_article_text(index, article['article_url'])))
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def dump_articles(articles: List[Dict[str, Any]], path: Union[str, Path]) -> int:
+        """
+        Write scraped articles to a JSON Lines file, one article per line.
+        
+        Each article is serialized and written on its own, so a large scrape is
+        never encoded as one giant string.
+        
+        Args:
+            articles: Article data dictionaries, as returned by scrape()
+            path: Path of the file to write
+            
+        Returns:
+            Number of articles written
+        """
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                for article in articles:
+                    f.write(orjson.dumps(article, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                for article in articles:
+                    f.write(json.dumps(article, ensure_ascii=False, separators=(',', ':')))
+                    f.write('\n')
+        return len(articles)
     
     async def scrape(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -195,13 +445,13 @@ class NewsBankScraper:
             limit: Optional limit on the number of articles to scrape
             
         Returns:
-            List of article data dictionaries
+            List of article data dictionaries (all articles share one 'location' dict)
         """
         await self._init_session()
         try:
             # First get search result pages
-            first_page_html = await self.fetch_search_page(0)
-            total_results = await self.parser.get_total_results(first_page_html)
+            first_page_html, first_page_charset = await self.fetch_search_page(0)
+            total_results = await self.parser.get_total_results(first_page_html, first_page_charset)
             
             # Get results per page from config or default to 20
             results_per_page = int(self.config['query_params'].get('maxresults', '20'))
@@ -215,20 +465,44 @@ class NewsBankScraper:
                 total_pages = min(math.ceil(limit / results_per_page), total_pages)
                 logger.info(f"Limiting to first {total_pages} pages")
             
-            # STAGE 1: Get all search result pages concurrently (with progress bar)
-            logger.info("Stage 1: Fetching search result pages...")
-            search_page_tasks = [self.fetch_search_page(i) for i in range(total_pages)]
-            search_pages = []
+            # STAGE 1: Get all search result pages concurrently (with progress bar),
+            # handing fetched pages to the parser pool in batches as they arrive so
+            # parsing overlaps with the fetches still in flight
+            logger.info("Stage 1: Fetching and parsing search result pages...")
+            parse_tasks = []
+            
+            # Small enough batches that every parser worker gets a share of the pages
+            batch_size = max(min(SEARCH_PAGE_BATCH_SIZE, math.ceil(total_pages / self.parser.num_workers)), 1)
+            
+            # The first page is already in hand, so parse it rather than fetching it again
+            # and let its HTML go as soon as the parser is done with it
+            batch = [(0, first_page_html, first_page_charset)] if total_pages else []
+            del first_page_html
             
-            for f in async_tqdm.as_completed(search_page_tasks, desc="Fetching search pages", total=len(search_page_tasks)):
-                search_pages.append(await f)
+            search_page_tasks = [self._fetch_indexed_search_page(i) for i in range(1, total_pages)]
+            with tqdm(total=len(search_page_tasks), desc="Fetching search pages", mininterval=PROGRESS_INTERVAL) as pbar:
+                for f in asyncio.as_completed(search_page_tasks):
+                    batch.append(await f)
+                    pbar.update(1)
+                    if len(batch) >= batch_size:
+                        parse_tasks.append(asyncio.ensure_future(self._parse_search_page_batch(batch)))
+                        batch = []
             
-            # STAGE 2: Extract article info from all pages (with progress bar)
-            logger.info("Stage 2: Extracting article information...")
+            if batch:
+                parse_tasks.append(asyncio.ensure_future(self._parse_search_page_batch(batch)))
+            del batch
+            
+            # STAGE 2: Collect article info from all pages, in page order
+            logger.info("Stage 2: Collecting article information...")
             all_articles = []
             
-            for i, page_html in enumerate(tqdm(search_pages, desc="Parsing search pages")):
-                articles = await self.parser.extract_articles_from_search_page(page_html)
+            # Only the parsed article lists are kept; no page HTML outlives its parse
+            page_articles = {}
+            for batch_articles in await asyncio.gather(*parse_tasks):
+                page_articles.update(batch_articles)
+            
+            for page_index in range(total_pages):
+                articles = page_articles.pop(page_index)
                 
                 # Add location to each article
                 for article in articles:
@@ -245,33 +519,40 @@ class NewsBankScraper:
 
             if self.full_text:
                 logger.info(f"Stage 3: Fetching full text for {len(all_articles)} articles...")
-                text_tasks = [self.fetch_article_text(article['article_url']) for article in all_articles]
-                article_texts = []
+                article_texts = [""] * len(all_articles)
                 
-                for f in async_tqdm.as_completed(text_tasks, desc="Fetching article texts", total=len(text_tasks)):
-                    article_texts.append(await f)
+                # Texts arrive out of order, so each is stored at its article's index
+                with tqdm(total=len(all_articles), desc="Fetching article texts", mininterval=PROGRESS_INTERVAL) as pbar:
+                    async for index, text in self.iter_article_texts(all_articles):
+                        article_texts[index] = text
+                        pbar.update(1)
                 
             # Format final output
-            final_articles = []
-            for i in range(len(all_articles)):
-                # Get location parts
-                location = all_articles[i]['location']
-                
-                # Create clean article object with only needed fields
-                final_article = {
-                    'title': all_articles[i]['title'],
-                    'date': self.parser.convert_date_to_iso(all_articles[i]['date']),
-                    'source': all_articles[i]['source'],
-                    'author': all_articles[i]['author'],
-                    'location': {
-                        'city': location.get('city', ''),
-                        'state': location.get('state', ''),
-                        'country': location.get('country', '')
-                    },
-                    'text': article_texts[i] if self.full_text else "",
-                    'url': self.get_absolute_url(all_articles[i]['article_url'])
+            texts = article_texts if self.full_text else itertools.repeat("")
+            
+            # The location is the same for every article, so they all share one dict
+            location = {
+                'city': self.location.get('city', ''),
+                'state': self.location.get('state', ''),
+                'country': self.location.get('country', '')
+            }
+            
+            convert_date = self.parser.convert_date_to_iso
+            get_absolute_url = self.get_absolute_url
+            
+            # Create clean article objects with only needed fields
+            final_articles = [
+                {
+                    'title': article['title'],
+                    'date': convert_date(article['date']),
+                    'source': article['source'],
+                    'author': article['author'],
+                    'location': location,
+                    'text': text,
+                    'url': get_absolute_url(article['article_url'])
                 }
-                final_articles.append(final_article)
+                for article, text in zip(all_articles, texts)
+            ]
             
             return final_articles
             
@@ -0,0 +1,123 @@
+"""
+Tests for the NewsBank HTML parser.
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+from NewsbankScraper.parser import NewsBankParser, extract_article_text_mp, extract_articles_mp
+
+TEST_PAGE = (Path(__file__).resolve().parent.parent / 'test.html').read_bytes()
+
+# A search page with a single hit, like the last page of a search
+ONE_HIT_PAGE = (
+    b'<html><head><meta charset="utf-8"></head><body>'
+    b'<article class="search-hits__hit" data-docref="news/1">'
+    b'<h3 class="search-hits__title"><a href="/apps/news/document-view?docref=news/1">Title</a></h3>'
+    b'<ul class="search-hits__hit__meta">'
+    b'<li class="search-hits__hit__meta__item--display-date">March 5, 2024</li>'
+    b'<li class="search-hits__hit__meta__item--source">Src</li>'
+    b'</ul></article></body></html>'
+)
+
+
+def _page_with_ld_json(data, page: bytes = TEST_PAGE) -> bytes:
+    """Return a search page with a JSON-LD block added to its <head>."""
+    block = f'<script type="application/ld+json">{json.dumps(data)}</script></head>'
+    return page.replace(b'</head>', block.encode('utf-8'), 1)
+
+
+def _ld_article(docref: str, headline: str) -> dict:
+    """Build a JSON-LD NewsArticle linking to the given document."""
+    return {
+        '@type': 'NewsArticle',
+        'headline': headline,
+        'url': f'/apps/news/document-view?docref={docref}',
+        'datePublished': '2024-01-01',
+        'publisher': {'name': 'Publisher'},
+    }
+
+
+class LdJsonTests(unittest.TestCase):
+    """JSON-LD must never break or shrink the markup scrape of a search page"""
+
+    def test_non_string_type_is_ignored(self):
+        baseline = extract_articles_mp(TEST_PAGE)
+        for node_type in ({'@id': 'schema:NewsArticle'}, [{'@id': 'x'}, 'WebPage']):
+            with self.subTest(node_type=node_type):
+                page = _page_with_ld_json({'@type': node_type, 'name': 'Search results'})
+                self.assertEqual(extract_articles_mp(page), baseline)
+
+    def test_unrelated_article_does_not_replace_hits(self):
+        for page in (TEST_PAGE, ONE_HIT_PAGE):
+            with self.subTest(hits=len(extract_articles_mp(page))):
+                ld_page = _page_with_ld_json(_ld_article('news/unrelated', 'Unrelated'), page)
+                self.assertEqual(extract_articles_mp(ld_page), extract_articles_mp(page))
+
+    def test_matching_article_is_used(self):
+        page = _page_with_ld_json(_ld_article('news%2F1', 'From JSON-LD'), ONE_HIT_PAGE)
+        [article] = extract_articles_mp(page)
+        self.assertEqual(article['title'], 'From JSON-LD')
+        self.assertEqual(article['article_id'], 'news/1')
+
+
+class MetadataFallbackTests(unittest.TestCase):
+    """Metadata list items are matched the way the original selectors matched them"""
+
+    def test_date_text_wins_over_other_field_classes(self):
+        page = (
+            b'<html><head><meta charset="utf-8"></head><body>'
+            b'<article class="search-hits__hit" data-docref="news/1">'
+            b'<h3 class="search-hits__title"><a href="/apps/news/document-view?docref=news/1">Title</a></h3>'
+            b'<ul class="search-hits__hit__meta">'
+            b'<li class="search-hits__hit__meta__item--source">Src</li>'
+            b'<li class="byline-author">March 5, 2024</li>'
+            b'</ul></article></body></html>'
+        )
+        [article] = extract_articles_mp(page)
+        self.assertEqual(article['date'], 'March 5, 2024')
+        self.assertEqual(article['source'], 'Src')
+
+
+class ConvertDateTests(unittest.TestCase):
+    """Dates convert exactly as strptime('%B %d, %Y') would"""
+
+    def test_canonical_dates(self):
+        self.assertEqual(NewsBankParser.convert_date_to_iso('March 5, 2024'), '2024-03-05')
+        self.assertEqual(NewsBankParser.convert_date_to_iso('november 29, 2024'), '2024-11-29')
+
+    def test_inputs_strptime_rejects(self):
+        for date_str in ('March 5, 24', 'March 5, 202', 'March 5 , 2024', 'March 5, 2024 ',
+                         'March +5, 2024', 'March \u0665, 2024', 'February 30, 2024'):
+            with self.subTest(date_str=date_str):
+                with self.assertRaises(ValueError):
+                    NewsBankParser.convert_date_to_iso(date_str)
+
+
+class CharsetTests(unittest.TestCase):
+    """Bytes are read with the header charset, then the page's own, then UTF-8"""
+
+    @staticmethod
+    def _article(text: str, head: str = '') -> str:
+        return f'<html><head>{head}</head><body><div class="document-body">{text}</div></body></html>'
+
+    def test_header_charset_wins(self):
+        page = self._article('Café', '<meta charset="utf-8">').encode('windows-1252')
+        for charset in ('windows-1252', 'latin-1'):
+            with self.subTest(charset=charset):
+                self.assertEqual(extract_article_text_mp(page, charset), 'Café')
+
+    def test_document_charset(self):
+        page = self._article('Café', '<meta charset="windows-1252">').encode('windows-1252')
+        self.assertEqual(extract_article_text_mp(page), 'Café')
+
+    def test_undeclared_is_utf8(self):
+        page = self._article('Café').encode('utf-8')
+        for charset in (None, 'not-a-charset'):
+            with self.subTest(charset=charset):
+                self.assertEqual(extract_article_text_mp(page, charset), 'Café')
+
+
+if __name__ == '__main__':
+    unittest.main()
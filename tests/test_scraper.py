@@ -0,0 +1,187 @@
+"""
+Tests for the scraper's HTTP handling, run against a local aiohttp server.
+"""
+
+import asyncio
+import gzip
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from NewsbankScraper import scraper as scraper_module
+from NewsbankScraper.scraper import NewsBankScraper, RateLimiter, ResponseRejected, _retry_after_seconds
+
+ARTICLE_PAGE = b'<html><head><meta charset="utf-8"></head><body><div class="document-body">Article text</div></body></html>'
+
+
+class ScraperServerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs each test against a fresh local server and scraper session"""
+
+    max_bytes = 1000
+
+    def routes(self):
+        """Map of path to handler served by the test server."""
+        return {}
+
+    async def asyncSetUp(self):
+        app = web.Application()
+        for path, handler in self.routes().items():
+            app.router.add_get(path, handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        self.scraper = NewsBankScraper(
+            {
+                'base_url': str(self.server.make_url('/apps/news/results')),
+                'headers': {},
+                'cookies': {},
+                'query_params': {},
+            },
+            rate_limit=0.0,
+            num_processors=1,
+            max_bytes=self.max_bytes,
+        )
+        await self.scraper._init_session()
+
+    async def asyncTearDown(self):
+        await self.scraper._close_session()
+        self.scraper.parser.shutdown()
+        await self.server.close()
+
+
+class RejectedResponseTests(ScraperServerTestCase):
+    """Non-HTML and oversized responses are rejected unread"""
+
+    def routes(self):
+        async def article(request):
+            return web.Response(body=ARTICLE_PAGE, content_type='text/html')
+
+        async def pdf(request):
+            return web.Response(body=b'%PDF-1.4', content_type='application/pdf')
+
+        async def oversized_gzip(request):
+            # Small on the wire, well over max_bytes once decompressed
+            body = gzip.compress(b'<p>' + b'x' * 100000 + b'</p>')
+            return web.Response(body=body, headers={'Content-Type': 'text/html', 'Content-Encoding': 'gzip'})
+
+        return {
+            '/apps/news/document-view': article,
+            '/apps/news/pdf': pdf,
+            '/apps/news/gzip': oversized_gzip,
+            '/apps/news/results': pdf,
+        }
+
+    async def test_rejected_article_pages_give_empty_text(self):
+        self.assertEqual(await self.scraper.fetch_article_text('/apps/news/document-view?docref=news/1'), 'Article text')
+        with self.assertLogs('NewsbankScraper.scraper', level='WARNING'):
+            self.assertEqual(await self.scraper.fetch_article_text('/apps/news/pdf?docref=news/2'), '')
+        with self.assertLogs('NewsbankScraper.scraper', level='WARNING'):
+            self.assertEqual(await self.scraper.fetch_article_text('/apps/news/gzip?docref=news/3'), '')
+
+    async def test_rejected_search_page_is_fatal(self):
+        with self.assertRaises(ResponseRejected):
+            await self.scraper.fetch_search_page(0)
+
+
+class CharsetTests(ScraperServerTestCase):
+    """A charset given only in the Content-Type header is used to read the page"""
+
+    def routes(self):
+        async def header_charset(request):
+            body = '<html><body><div class="document-body">Café</div></body></html>'.encode('windows-1252')
+            return web.Response(body=body, headers={'Content-Type': 'text/html; charset=windows-1252'})
+
+        return {'/apps/news/document-view': header_charset}
+
+    async def test_header_charset(self):
+        self.assertEqual(await self.scraper.fetch_article_text('/apps/news/document-view?docref=news/1'), 'Café')
+
+
+class RateLimiterTests(unittest.IsolatedAsyncioTestCase):
+    """max_rate acquisitions go through at once, later ones are spaced evenly"""
+
+    async def test_burst_then_spacing(self):
+        limiter = RateLimiter(4, 0.2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        times = []
+        for _ in range(7):
+            async with limiter:
+                times.append(loop.time() - start)
+
+        for t in times[:4]:
+            self.assertLess(t, 0.02)
+        # One token every time_period / max_rate = 0.05 s once the burst is spent
+        for earlier, later in zip(times[3:], times[4:]):
+            self.assertAlmostEqual(later - earlier, 0.05, delta=0.02)
+
+    async def test_zero_period_disables_limiting(self):
+        limiter = RateLimiter(1, 0.0)
+        await asyncio.wait_for(asyncio.gather(*(limiter.acquire() for _ in range(100))), timeout=1)
+
+
+class RetryAfterTests(unittest.TestCase):
+    """Retry-After is read as seconds or as an HTTP date"""
+
+    def test_seconds(self):
+        self.assertEqual(_retry_after_seconds('3'), 3.0)
+        self.assertEqual(_retry_after_seconds('-3'), 0.0)
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+        self.assertAlmostEqual(_retry_after_seconds(format_datetime(retry_at, usegmt=True)), 120, delta=2)
+        self.assertEqual(_retry_after_seconds('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+
+    def test_missing_or_invalid(self):
+        for value in (None, '', 'soon'):
+            with self.subTest(value=value):
+                self.assertIsNone(_retry_after_seconds(value))
+
+
+class RetryTests(ScraperServerTestCase):
+    """Transient failures are retried; other errors are not"""
+
+    def routes(self):
+        self.hits = {}
+
+        def failing_first(status, headers=None):
+            async def handler(request):
+                self.hits[request.path] = self.hits.get(request.path, 0) + 1
+                if self.hits[request.path] == 1:
+                    return web.Response(status=status, headers=headers)
+                return web.Response(body=b'<p>ok</p>', content_type='text/html')
+            return handler
+
+        return {
+            '/unavailable': failing_first(503),
+            '/throttled': failing_first(429, {'Retry-After': '86400'}),
+            '/missing': failing_first(404),
+        }
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        patcher = mock.patch.multiple(scraper_module, RETRY_BASE_DELAY=0.01, RETRY_MAX_DELAY=0.05, RETRY_JITTER=0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_retries_until_success(self):
+        self.assertEqual(await self.scraper.fetch_page(str(self.server.make_url('/unavailable'))), (b'<p>ok</p>', None))
+        self.assertEqual(self.hits['/unavailable'], 2)
+
+    async def test_retry_after_is_capped(self):
+        page = await asyncio.wait_for(self.scraper.fetch_page(str(self.server.make_url('/throttled'))), timeout=5)
+        self.assertEqual(page, (b'<p>ok</p>', None))
+
+    async def test_other_errors_are_not_retried(self):
+        with self.assertRaises(aiohttp.ClientResponseError):
+            await self.scraper.fetch_page(str(self.server.make_url('/missing')))
+        self.assertEqual(self.hits['/missing'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()